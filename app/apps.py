@@ -8,3 +8,7 @@ class AppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self) -> None:
+        """Register signal handlers."""
+        from app import signals  # noqa: F401
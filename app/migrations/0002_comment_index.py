@@ -0,0 +1,17 @@
+"""Add a (post, -created_at) index on comments."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(fields=["post", "-created_at"], name="comment_post_created_idx"),
+        ),
+    ]
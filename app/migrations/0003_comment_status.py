@@ -0,0 +1,41 @@
+"""Add publishing status and error fields to comments."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0002_comment_index"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="comment",
+            name="instagram_comment_id",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Instagram comment ID returned by the API",
+                max_length=255,
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("published", "Published"), ("failed", "Failed")],
+                default="published",
+                max_length=16,
+            ),
+        ),
+        migrations.AddField(
+            model_name="comment",
+            name="error",
+            field=models.TextField(
+                blank=True,
+                default="",
+                help_text="Last Instagram API error for failed comments",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+"""Shorten Instagram ID columns and make published comments unique per post."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0003_comment_status"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="instagram_id",
+            field=models.CharField(help_text="Instagram media object ID", max_length=32, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="comment",
+            name="instagram_comment_id",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                help_text="Instagram comment ID returned by the API",
+                max_length=32,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="comment",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("instagram_comment_id", ""), _negated=True),
+                fields=("post", "instagram_comment_id"),
+                name="uniq_comment_per_post",
+            ),
+        ),
+    ]
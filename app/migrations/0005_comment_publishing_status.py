@@ -0,0 +1,27 @@
+"""Add the ``publishing`` comment status used to claim pending comments."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("app", "0004_tighten_instagram_ids"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="comment",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("publishing", "Publishing"),
+                    ("published", "Published"),
+                    ("failed", "Failed"),
+                ],
+                default="published",
+                max_length=16,
+            ),
+        ),
+    ]
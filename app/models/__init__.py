@@ -1,6 +1,25 @@
 """Models for Instagram posts and comments."""
 
 from django.db import models
+from django.db.models import Prefetch
+
+
+class PostQuerySet(models.QuerySet):
+    """Query helpers for :class:`Post`."""
+
+    def with_comments(self) -> "PostQuerySet":
+        """Prefetch each post's comments in a single extra query."""
+        return self.prefetch_related(
+            Prefetch("comments", queryset=Comment.objects.all())
+        )
+
+
+class CommentQuerySet(models.QuerySet):
+    """Query helpers for :class:`Comment`."""
+
+    def with_post(self) -> "CommentQuerySet":
+        """Join the parent post so ``comment.post`` does not hit the DB again."""
+        return self.select_related("post")
 
 
 class Post(models.Model):
@@ -12,13 +31,15 @@ class Post(models.Model):
     """
 
     instagram_id: str = models.CharField(
-        max_length=255,
+        max_length=32,
         unique=True,
         help_text="Instagram media object ID",
     )
     caption: str = models.TextField(blank=True, default="")
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
 
+    objects = PostQuerySet.as_manager()
+
     class Meta:
         db_table = "posts"
         ordering = ["-created_at"]
@@ -29,27 +50,62 @@ class Post(models.Model):
 
 class Comment(models.Model):
     """
-    Represents a comment that was successfully posted to Instagram.
+    Represents a comment published (or queued for publishing) to Instagram.
 
-    After the Instagram API call succeeds, the comment is persisted
-    locally to keep a record of all published comments.
+    Comments created synchronously are persisted only after the Instagram
+    API call succeeds.  Comments created through the background flow are
+    stored as ``pending`` first, claimed as ``publishing`` by the
+    ``publish_comment`` task and updated once Instagram responds.
     """
 
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        PUBLISHING = "publishing", "Publishing"
+        PUBLISHED = "published", "Published"
+        FAILED = "failed", "Failed"
+
     post: Post = models.ForeignKey(
         Post,
         on_delete=models.CASCADE,
         related_name="comments",
     )
     instagram_comment_id: str = models.CharField(
-        max_length=255,
+        max_length=32,
+        blank=True,
+        default="",
+        db_index=True,
         help_text="Instagram comment ID returned by the API",
     )
     text: str = models.TextField()
+    status: str = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PUBLISHED,
+    )
+    error: str = models.TextField(
+        blank=True,
+        default="",
+        help_text="Last Instagram API error for failed comments",
+    )
     created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         db_table = "comments"
         ordering = ["-created_at"]
+        indexes = [
+            # Matches "comments for this post, newest first"
+            models.Index(fields=["post", "-created_at"], name="comment_post_created_idx"),
+        ]
+        constraints = [
+            # Pending comments have no Instagram ID yet, so only published ones are unique
+            models.UniqueConstraint(
+                fields=["post", "instagram_comment_id"],
+                condition=~models.Q(instagram_comment_id=""),
+                name="uniq_comment_per_post",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Comment(id={self.pk}, post_id={self.post_id})"
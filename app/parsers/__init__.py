@@ -0,0 +1,44 @@
+"""DRF parsers backed by ``orjson``."""
+
+from __future__ import annotations
+
+import codecs
+from typing import IO, Any
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from app.renderers import ORJSONRenderer
+
+
+class ORJSONParser(JSONParser):
+    """
+    Drop-in replacement for DRF's ``JSONParser`` using ``orjson``.
+
+    ``orjson`` decodes UTF-8 bytes directly, so a UTF-8 request body is
+    read as-is instead of being wrapped in a text decoder first.  Bodies
+    declaring any other charset are decoded with it before parsing, as
+    DRF's ``JSONParser`` does.
+    """
+
+    renderer_class = ORJSONRenderer
+
+    def parse(
+        self,
+        stream: IO[bytes],
+        media_type: str | None = None,
+        parser_context: dict[str, Any] | None = None,
+    ) -> Any:
+        """Parse the incoming bytestream as JSON and return the resulting data."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            body: bytes | str = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except (LookupError, UnicodeDecodeError, orjson.JSONDecodeError) as exc:
+            raise ParseError(f"JSON parse error - {exc}")
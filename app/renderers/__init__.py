@@ -0,0 +1,38 @@
+"""DRF renderers backed by ``orjson``."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's ``JSONRenderer`` using ``orjson``.
+
+    Types ``orjson`` does not handle natively (``Decimal``, lazy strings,
+    querysets, …) fall back to DRF's own ``JSONEncoder.default``.  Non-str
+    dict keys are stringified like the stdlib encoder does, since DRF
+    builds some error details (e.g. ``ListField``) keyed by index.
+    """
+
+    _fallback_encoder = JSONEncoder()
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Render ``data`` into JSON, returning a bytestring."""
+        if data is None:
+            return b""
+
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=self._fallback_encoder.default, option=option)
@@ -1,24 +1,89 @@
 """DRF serializers for Post and Comment resources."""
 
+from typing import Any
+
 from rest_framework import serializers
+from rest_framework.exceptions import ErrorDetail
 
 from app.models import Comment, Post
 
+COMMENT_TEXT_MAX_LENGTH = 2200
+
 
 class CommentSerializer(serializers.ModelSerializer):
     """Serializes a Comment instance to/from JSON."""
 
     class Meta:
         model = Comment
-        fields = ["id", "post", "instagram_comment_id", "text", "created_at"]
-        read_only_fields = ["id", "instagram_comment_id", "created_at"]
+        fields = ["id", "post", "instagram_comment_id", "text", "status", "created_at"]
+        read_only_fields = ["id", "instagram_comment_id", "status", "created_at"]
 
 
 class CreateCommentSerializer(serializers.Serializer):
-    """Validates the request body for comment creation."""
+    """
+    Describes the request body for comment creation.
+
+    The view validates with :func:`validate_comment_text` instead; this
+    serializer documents the same rules for schema generation.
+    """
 
     text: serializers.CharField = serializers.CharField(
         min_length=1,
-        max_length=2200,
+        max_length=COMMENT_TEXT_MAX_LENGTH,
         help_text="Comment text (Instagram limit: 2 200 characters)",
     )
+
+
+def validate_comment_text(data: Any) -> str:
+    """
+    Validate a comment-create request body and return the cleaned ``text``.
+
+    Applies the same rules and error messages as
+    :class:`CreateCommentSerializer` (surrounding whitespace is trimmed;
+    blank and over-long values, NUL and surrogate characters are rejected)
+    without instantiating it.
+
+    Raises:
+        serializers.ValidationError: The body or its ``text`` is invalid.
+    """
+    if not isinstance(data, dict):
+        raise serializers.ValidationError(
+            {"non_field_errors": [
+                f"Invalid data. Expected a dictionary, but got {type(data).__name__}."
+            ]},
+            code="invalid",
+        )
+
+    text = data.get("text")
+    if text is None:
+        if "text" not in data:
+            raise serializers.ValidationError({"text": ["This field is required."]}, code="required")
+        raise serializers.ValidationError({"text": ["This field may not be null."]}, code="null")
+    if isinstance(text, bool) or not isinstance(text, (str, int, float)):
+        raise serializers.ValidationError({"text": ["Not a valid string."]}, code="invalid")
+
+    text = str(text).strip()
+    if not text:
+        raise serializers.ValidationError({"text": ["This field may not be blank."]}, code="blank")
+
+    # Like DRF's field validators, report every failed check at once
+    errors: list[ErrorDetail] = []
+    if len(text) > COMMENT_TEXT_MAX_LENGTH:
+        errors.append(ErrorDetail(
+            f"Ensure this field has no more than {COMMENT_TEXT_MAX_LENGTH} characters.",
+            code="max_length",
+        ))
+    if "\x00" in text:
+        errors.append(ErrorDetail(
+            "Null characters are not allowed.",
+            code="null_characters_not_allowed",
+        ))
+    surrogate = next((ch for ch in text if 0xD800 <= ord(ch) <= 0xDFFF), None)
+    if surrogate is not None:
+        errors.append(ErrorDetail(
+            f"Surrogate characters are not allowed: U+{ord(surrogate):X}.",
+            code="surrogate_characters_not_allowed",
+        ))
+    if errors:
+        raise serializers.ValidationError({"text": errors})
+    return text
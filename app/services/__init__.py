@@ -1,12 +1,21 @@
 """Services package — business logic and external API integrations."""
 
-from app.services.instagram_client import InstagramClient, InstagramAPIError, MediaNotFoundError
-from app.services.comment_service import CommentService, PostNotFoundError
+from app.services.instagram_client import (
+    InstagramClient,
+    InstagramAPIError,
+    InstagramRequestUncertainError,
+    MediaNotFoundError,
+    get_instagram_client,
+)
+from app.services.comment_service import CommentService, PostNotFoundError, get_comment_service
 
 __all__ = [
     "InstagramClient",
     "InstagramAPIError",
+    "InstagramRequestUncertainError",
     "MediaNotFoundError",
+    "get_instagram_client",
     "CommentService",
     "PostNotFoundError",
+    "get_comment_service",
 ]
@@ -8,19 +8,37 @@ Instagram API call.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 
 from app.models import Comment, Post
-from app.services.instagram_client import InstagramClient, InstagramAPIError, MediaNotFoundError
+from app.services.instagram_client import (
+    InstagramClient,
+    InstagramAPIError,
+    InstagramRequestUncertainError,
+    MediaNotFoundError,
+    get_instagram_client,
+)
 
 if TYPE_CHECKING:
     pass
 
 
+POST_INSTAGRAM_ID_CACHE_TIMEOUT = 60 * 60
+
+
 class PostNotFoundError(Exception):
     """Raised when the requested Post does not exist in the local DB."""
 
 
+def post_instagram_id_cache_key(post_id: int) -> str:
+    """Cache key under which a post's Instagram media ID is stored."""
+    return f"post:ig_id:{post_id}"
+
+
 class CommentService:
     """
     Orchestrates comment creation across the local DB and Instagram API.
@@ -31,7 +49,8 @@ class CommentService:
     """
 
     def __init__(self, instagram_client: InstagramClient | None = None) -> None:
-        self._client: InstagramClient = instagram_client or InstagramClient()
+        self._client: InstagramClient = instagram_client or get_instagram_client()
+        self._cache_instagram_ids: bool = settings.CACHE_POST_INSTAGRAM_IDS
 
     def create_comment(self, post_id: int, text: str) -> Comment:
         """
@@ -41,6 +60,8 @@ class CommentService:
         1. Verify the post exists in the local DB — raise ``PostNotFoundError`` otherwise.
         2. Send the comment to the Instagram Graph API via ``InstagramClient``.
         3. On success, save the new ``Comment`` record to the database and return it.
+           If a record for the same Instagram comment already exists (a retried
+           call), that record is returned instead of inserting a duplicate.
 
         Any ``InstagramAPIError`` raised by the client propagates to the caller
         (i.e., the View) so it can be translated into an appropriate HTTP response.
@@ -57,23 +78,241 @@ class CommentService:
             MediaNotFoundError:  The post's Instagram media no longer exists.
             InstagramAPIError:   Any other Instagram API failure.
         """
-        # Step 1 — verify local post exists
-        try:
-            post: Post = Post.objects.get(pk=post_id)
-        except Post.DoesNotExist:
-            raise PostNotFoundError(f"Post with id={post_id} not found")
+        # Step 1 — verify local post exists (only the media ID is needed)
+        instagram_id = self._get_instagram_id(post_id)
 
         # Step 2 — publish to Instagram
         api_response = self._client.create_comment(
-            media_id=post.instagram_id,
+            media_id=instagram_id,
             message=text,
         )
 
-        # Step 3 — persist locally
-        instagram_comment_id: str = api_response["id"]
+        # Step 3 — persist locally; a retry that already saved this
+        # Instagram comment gets the existing row back
+        return self._save_comment(
+            Comment(post_id=post_id, instagram_comment_id=api_response["id"], text=text)
+        )
+
+    def create_comments_bulk(
+        self, post_id: int, texts: list[str]
+    ) -> list[Comment | InstagramAPIError]:
+        """
+        Publish several comments on one post and persist them in bulk.
+
+        The Instagram calls run concurrently (see
+        :meth:`InstagramClient.create_comments`); every comment Instagram
+        accepted is then saved with a single batched ``INSERT``.  A failed
+        message does not prevent the others from being saved.  If the batch
+        hits an integrity error (e.g. some comments were already saved by a
+        retried call) the rows are saved one by one instead, exactly as
+        :meth:`create_comment` does.
+
+        Args:
+            post_id: Primary key of the local ``Post`` record.
+            texts:   Comment texts to publish.
+
+        Returns:
+            For each text, in order, either the saved :class:`Comment` or
+            the ``InstagramAPIError`` Instagram returned for it.
+
+        Raises:
+            PostNotFoundError: The post does not exist in the local DB.
+        """
+        instagram_id = self._get_instagram_id(post_id)
+        api_results = self._client.create_comments(instagram_id, texts)
+
+        results: list[Comment | InstagramAPIError] = [
+            result if isinstance(result, InstagramAPIError) else Comment(
+                post_id=post_id,
+                instagram_comment_id=result["id"],
+                text=text,
+            )
+            for result, text in zip(api_results, texts)
+        ]
+        comments = [r for r in results if isinstance(r, Comment)]
+        try:
+            with transaction.atomic():
+                Comment.objects.bulk_create(comments, batch_size=500)
+        except IntegrityError:
+            # Earlier batches may have assigned primary keys before the rollback
+            for comment in comments:
+                comment.pk = None
+            results = [self._save_comment(r) if isinstance(r, Comment) else r for r in results]
+        return results
+
+    def enqueue_comment(self, post_id: int, text: str) -> Comment:
+        """
+        Store a ``pending`` comment and schedule it for publishing.
+
+        The Instagram API call is performed later by the ``publish_comment``
+        Celery task, so the caller returns without waiting on Instagram.
+        The task is dispatched only once the surrounding transaction commits.
+
+        Args:
+            post_id: Primary key of the local ``Post`` record.
+            text:    Comment text to publish.
+
+        Returns:
+            The newly created, still-pending :class:`Comment` instance.
+
+        Raises:
+            PostNotFoundError: The post does not exist in the local DB.
+        """
+        from app.tasks import publish_comment
+
+        if not Post.objects.filter(pk=post_id).exists():
+            raise PostNotFoundError(f"Post with id={post_id} not found")
+
         comment = Comment.objects.create(
-            post=post,
-            instagram_comment_id=instagram_comment_id,
+            post_id=post_id,
             text=text,
+            status=Comment.Status.PENDING,
+        )
+        transaction.on_commit(lambda: publish_comment.delay(comment.pk))
+        return comment
+
+    def publish_pending_comment(self, comment_id: int) -> Comment | None:
+        """
+        Publish a ``pending`` comment to Instagram and mark it ``published``.
+
+        The comment is first claimed by atomically switching it from
+        ``pending`` to ``publishing``, so a redelivered task cannot publish
+        it twice.  The Instagram call itself runs outside any transaction.
+        If Instagram definitely rejected the call the claim is released
+        (back to ``pending``) so the caller can retry or mark the comment
+        failed.  If the comment may have been created anyway (e.g. a read
+        timeout), or anything else goes wrong after the claim, it is marked
+        ``failed`` with the error recorded instead, so it is never left
+        ``publishing``, never re-sent automatically, and can be reconciled
+        by hand.
+
+        Args:
+            comment_id: Primary key of the pending ``Comment``.
+
+        Returns:
+            The updated :class:`Comment`, or ``None`` if no pending comment
+            with that id exists or another worker has already claimed it.
+
+        Raises:
+            MediaNotFoundError:  The post's Instagram media no longer exists.
+            InstagramRequestUncertainError: The outcome of the call is unknown.
+            InstagramAPIError:   Any other Instagram API failure.
+        """
+        claimed = Comment.objects.filter(
+            pk=comment_id,
+            status=Comment.Status.PENDING,
+        ).update(status=Comment.Status.PUBLISHING)
+        if not claimed:
+            return None
+
+        api_response: dict[str, Any] | None = None
+        try:
+            comment = Comment.objects.with_post().get(pk=comment_id)
+            api_response = self._client.create_comment(
+                media_id=comment.post.instagram_id,
+                message=comment.text,
+            )
+            comment.instagram_comment_id = api_response["id"]
+            comment.status = Comment.Status.PUBLISHED
+            comment.error = ""
+            comment.save(update_fields=["instagram_comment_id", "status", "error"])
+        except InstagramRequestUncertainError as exc:
+            self.mark_comment_failed(comment_id, str(exc))
+            raise
+        except InstagramAPIError:
+            Comment.objects.filter(pk=comment_id, status=Comment.Status.PUBLISHING).update(
+                status=Comment.Status.PENDING,
+            )
+            raise
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            if api_response is not None:
+                # The comment is live; keep its Instagram ID for reconciliation
+                error = f"Published as {api_response.get('id')!r} but not saved: {error}"
+            self.mark_comment_failed(comment_id, error)
+            raise
+        return comment
+
+    def mark_comment_failed(self, comment_id: int, error: str) -> None:
+        """Record a permanent publishing failure on a pending or publishing comment."""
+        Comment.objects.filter(
+            pk=comment_id,
+            status__in=[Comment.Status.PENDING, Comment.Status.PUBLISHING],
+        ).update(
+            status=Comment.Status.FAILED,
+            error=error,
         )
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _save_comment(self, comment: Comment) -> Comment:
+        """
+        Insert a published comment, tolerating an already-saved duplicate.
+
+        Returns the saved ``comment``, or the existing row for the same
+        Instagram comment if a retried call already stored it.
+
+        Raises:
+            PostNotFoundError: The post was deleted before the insert.
+            IntegrityError:    Any other constraint violation.
+        """
+        try:
+            with transaction.atomic():
+                comment.save(force_insert=True)
+        except IntegrityError as exc:
+            # Only a duplicate of an already-saved row is recoverable; a post
+            # deleted meanwhile is reported as missing, anything else propagates
+            existing = Comment.objects.filter(
+                post_id=comment.post_id,
+                instagram_comment_id=comment.instagram_comment_id,
+            ).first()
+            if existing is not None:
+                return existing
+            if not Post.objects.filter(pk=comment.post_id).exists():
+                cache.delete(post_instagram_id_cache_key(comment.post_id))
+                raise PostNotFoundError(f"Post with id={comment.post_id} not found") from exc
+            raise
         return comment
+
+    def _get_instagram_id(self, post_id: int) -> str:
+        """
+        Return the Instagram media ID of a local post.
+
+        A post's media ID never changes once created, so with
+        ``CACHE_POST_INSTAGRAM_IDS`` enabled (a shared cache is configured)
+        it is cached by ``post_id``; the entry is dropped when the post is
+        deleted (see :mod:`app.signals`).  Missing posts are not cached.
+
+        Raises:
+            PostNotFoundError: The post does not exist in the local DB.
+        """
+        key = post_instagram_id_cache_key(post_id)
+        if self._cache_instagram_ids:
+            instagram_id: str | None = cache.get(key)
+            if instagram_id is not None:
+                return instagram_id
+
+        instagram_id = (
+            Post.objects.filter(pk=post_id)
+            .values_list("instagram_id", flat=True)
+            .first()
+        )
+        if instagram_id is None:
+            raise PostNotFoundError(f"Post with id={post_id} not found")
+
+        if self._cache_instagram_ids:
+            cache.set(key, instagram_id, timeout=POST_INSTAGRAM_ID_CACHE_TIMEOUT)
+        return instagram_id
+
+
+_default_service: CommentService | None = None
+
+
+def get_comment_service() -> CommentService:
+    """Return the process-wide :class:`CommentService`, creating it on first use."""
+    global _default_service
+    if _default_service is None:
+        _default_service = CommentService()
+    return _default_service
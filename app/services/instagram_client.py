@@ -6,10 +6,20 @@ All network requests to Instagram are isolated here so they can be easily
 mocked in tests without affecting any other application logic.
 """
 
+import asyncio
+import collections
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
+import aiohttp
+import orjson
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class InstagramAPIError(Exception):
@@ -24,6 +34,183 @@ class MediaNotFoundError(InstagramAPIError):
     """Raised when the requested Instagram media object does not exist."""
 
 
+class InstagramRequestUncertainError(InstagramAPIError):
+    """
+    Raised when a request may have reached Instagram but its outcome is unknown.
+
+    Covers read timeouts and server errors (5xx) that carry no Graph API
+    error body.  A non-idempotent call such as creating a comment may have
+    succeeded, so callers must not blindly re-send it.
+    """
+
+
+class _Limiter:
+    """
+    Adaptive (AIMD) concurrency limiter for outbound Graph API calls.
+
+    The concurrency limit grows additively while the mean latency over a
+    sliding window stays at or below ``target_latency`` and is halved on
+    throttling (429), gateway errors (502/503/504) or network failures.
+    Only calls started after the last decrease can halve it again, so a
+    burst of failures from one round of in-flight calls counts once.
+    A ``Retry-After`` header (capped at ``MAX_BACKOFF`` seconds) pauses
+    all new calls until it expires; callers give up after
+    ``ACQUIRE_TIMEOUT`` seconds rather than queueing indefinitely.
+    """
+
+    BACKOFF_STATUSES = frozenset({0, 429, 502, 503, 504})
+    MAX_BACKOFF = 60.0
+    ACQUIRE_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        initial: float = 8,
+        minimum: float = 1,
+        maximum: float = 32,
+        target_latency: float = 1.0,
+        window: int = 20,
+    ) -> None:
+        self.limit: float = initial
+        self._min = minimum
+        self._max = maximum
+        self._target_latency = target_latency
+        self._latencies: collections.deque[float] = collections.deque(maxlen=window)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def acquire(self, timeout: float | None = None) -> Iterator[None]:
+        """
+        Block until a concurrency slot is free and no back-off is active.
+
+        Raises:
+            InstagramAPIError: No slot became available within ``timeout``
+                seconds (default ``ACQUIRE_TIMEOUT``); nothing was sent.
+        """
+        deadline = time.monotonic() + (self.ACQUIRE_TIMEOUT if timeout is None else timeout)
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                delay = self._blocked_until - now
+                if delay <= 0 and self._in_flight < int(self.limit):
+                    break
+                remaining = deadline - now
+                if remaining <= 0 or self._blocked_until > deadline:
+                    raise InstagramAPIError("Timed out waiting for Instagram API capacity")
+                self._cond.wait(timeout=min(delay, remaining) if delay > 0 else remaining)
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+
+    def backoff_remaining(self) -> float:
+        """Seconds left before a ``Retry-After`` pause expires (``0`` if none)."""
+        with self._cond:
+            return max(0.0, self._blocked_until - time.monotonic())
+
+    def observe(self, latency: float, status_code: int, headers: Mapping[str, str]) -> None:
+        """
+        Feed the outcome of one call back into the controller.
+
+        Args:
+            latency:     Wall-clock duration of the call in seconds.
+            status_code: HTTP status, or ``0`` for a network failure.
+            headers:     Response headers (empty for a network failure).
+        """
+        retry_after = _parse_retry_after(headers)
+        exhausted = any(
+            name.lower().startswith("x-ratelimit-remaining") and value.strip() == "0"
+            for name, value in headers.items()
+        )
+
+        with self._cond:
+            now = time.monotonic()
+            self._latencies.append(latency)
+            if retry_after:
+                retry_after = min(retry_after, self.MAX_BACKOFF)
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+            mean_latency = sum(self._latencies) / len(self._latencies)
+            if (
+                status_code in self.BACKOFF_STATUSES
+                or exhausted
+                or mean_latency > self._target_latency
+            ):
+                # A call started before the last decrease ran at the old limit
+                if now - latency >= self._last_decrease:
+                    self.limit = max(self._min, self.limit * 0.5)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self._max, self.limit + 0.5)
+            self._cond.notify_all()
+
+
+class _AsyncGate:
+    """
+    Event-loop counterpart of :meth:`_Limiter.acquire`.
+
+    Caps the number of in-flight ``aiohttp`` calls at the shared limiter's
+    current ``limit`` (re-read on every acquire, so AIMD changes apply
+    immediately) and waits out any active ``Retry-After`` pause, giving up
+    after the limiter's ``ACQUIRE_TIMEOUT``.  Must be created and used on
+    a single event loop.
+    """
+
+    def __init__(self, limiter: _Limiter) -> None:
+        self._limiter = limiter
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @asynccontextmanager
+    async def acquire(self, timeout: float | None = None) -> AsyncIterator[None]:
+        """
+        Wait until a concurrency slot is free and no back-off is active.
+
+        Raises:
+            InstagramAPIError: No slot became available within ``timeout``
+                seconds (default ``ACQUIRE_TIMEOUT``); nothing was sent.
+        """
+        if timeout is None:
+            timeout = self._limiter.ACQUIRE_TIMEOUT
+        deadline = time.monotonic() + timeout
+        async with self._cond:
+            try:
+                await asyncio.wait_for(
+                    self._cond.wait_for(lambda: self._in_flight < int(self._limiter.limit)),
+                    timeout,
+                )
+            except asyncio.TimeoutError:
+                raise InstagramAPIError("Timed out waiting for Instagram API capacity") from None
+            self._in_flight += 1
+        try:
+            backoff = self._limiter.backoff_remaining()
+            if backoff > deadline - time.monotonic():
+                raise InstagramAPIError("Timed out waiting for Instagram API capacity")
+            if backoff:
+                await asyncio.sleep(backoff)
+            yield
+        finally:
+            async with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+
+def _parse_retry_after(headers: Mapping[str, str]) -> float:
+    """Return the ``Retry-After`` delay in seconds, or ``0`` if absent/unparseable."""
+    value = headers.get("Retry-After") or headers.get("retry-after")
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return 0.0
+
+
 class InstagramClient:
     """
     HTTP client for the Instagram Graph API.
@@ -31,11 +218,29 @@ class InstagramClient:
     Wraps the ``requests`` library and handles authentication, error
     parsing, and response normalisation so that callers only deal with
     clean Python objects or typed exceptions.
+
+    All calls go through a single pooled ``requests.Session`` so that
+    TCP/TLS connections to the Graph API are kept alive and reused, and
+    are paced by an adaptive limiter so that throttling responses reduce
+    the request rate instead of triggering blind retries.
+
+    For fan-out workloads an ``aiohttp`` transport is also available:
+    :meth:`async_create_comment` for async callers and :meth:`create_comments`
+    as a sync entry-point that runs many calls concurrently on a private
+    background event loop.
     """
 
+    MAX_CONNECTIONS_PER_HOST = 64
+
     def __init__(self, access_token: str | None = None) -> None:
         self._access_token: str = access_token or settings.INSTAGRAM_ACCESS_TOKEN
         self._base_url: str = settings.INSTAGRAM_API_BASE_URL
+        self._session: requests.Session = self._build_session()
+        self._limiter = _Limiter()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._aio_session: aiohttp.ClientSession | None = None
+        self._aio_gate: _AsyncGate | None = None
 
     # ------------------------------------------------------------------
     # Public methods
@@ -56,6 +261,31 @@ class InstagramClient:
 
         Raises:
             MediaNotFoundError: If the media object no longer exists on Instagram.
+            InstagramRequestUncertainError: If the comment may have been
+                created but no usable response arrived.
+            InstagramAPIError:  For any other non-successful API response.
+        """
+        url = f"{self._base_url}/{media_id}/comments"
+        payload = {
+            "message": message,
+            "access_token": self._access_token,
+        }
+
+        response = self._send(self._session.post, url, json=payload, timeout=10)
+        return self._handle_response(response, media_id=media_id)
+
+    async def async_create_comment(self, media_id: str, message: str) -> dict[str, Any]:
+        """
+        Async variant of :meth:`create_comment` built on ``aiohttp``.
+
+        Must be awaited on the loop that owns this client's ``aiohttp``
+        session — in practice, via :meth:`create_comments`.  Concurrency is
+        capped by the same adaptive limit as the ``requests`` transport.
+
+        Raises:
+            MediaNotFoundError: If the media object no longer exists on Instagram.
+            InstagramRequestUncertainError: If the comment may have been
+                created but no usable response arrived.
             InstagramAPIError:  For any other non-successful API response.
         """
         url = f"{self._base_url}/{media_id}/comments"
@@ -64,12 +294,60 @@ class InstagramClient:
             "access_token": self._access_token,
         }
 
+        session = self._get_aio_session()
+        async with self._get_aio_gate().acquire():
+            started = time.monotonic()
+            try:
+                async with session.post(url, json=payload) as response:
+                    body = await response.read()
+            except asyncio.TimeoutError as exc:
+                self._limiter.observe(time.monotonic() - started, 0, {})
+                raise InstagramRequestUncertainError(
+                    f"Timed out waiting for Instagram API response: {exc}"
+                ) from exc
+            except aiohttp.ClientError as exc:
+                self._limiter.observe(time.monotonic() - started, 0, {})
+                raise InstagramAPIError(
+                    f"Network error while calling Instagram API: {exc}"
+                ) from exc
+            self._limiter.observe(time.monotonic() - started, response.status, response.headers)
+
         try:
-            response = requests.post(url, json=payload, timeout=10)
-        except requests.RequestException as exc:
-            raise InstagramAPIError(f"Network error while calling Instagram API: {exc}") from exc
+            data: dict[str, Any] = orjson.loads(body)
+        except orjson.JSONDecodeError as exc:
+            raise self._invalid_json_error(response.status) from exc
+
+        return self._check_payload(
+            data,
+            ok=response.ok,
+            status_code=response.status,
+            text=body.decode("utf-8", "replace"),
+            media_id=media_id,
+        )
+
+    def create_comments(
+        self, media_id: str, messages: list[str]
+    ) -> list[dict[str, Any] | InstagramAPIError]:
+        """
+        Publish several comments on one media object concurrently.
 
-        return self._handle_response(response, media_id=media_id)
+        Blocks the calling thread until every call has finished.  Failures
+        do not cancel the remaining calls: each position in the result holds
+        either the API response dict or the ``InstagramAPIError`` raised for
+        that message, in input order.
+        """
+        async def _gather() -> list[Any]:
+            return await asyncio.gather(
+                *(self.async_create_comment(media_id, m) for m in messages),
+                return_exceptions=True,
+            )
+
+        future = asyncio.run_coroutine_threadsafe(_gather(), self._get_loop())
+        results = future.result()
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, InstagramAPIError):
+                raise result
+        return results
 
     def get_media(self, media_id: str) -> dict[str, Any]:
         """
@@ -91,17 +369,109 @@ class InstagramClient:
             "access_token": self._access_token,
         }
 
-        try:
-            response = requests.get(url, params=params, timeout=10)
-        except requests.RequestException as exc:
-            raise InstagramAPIError(f"Network error while calling Instagram API: {exc}") from exc
-
+        response = self._send(self._session.get, url, params=params, timeout=10)
         return self._handle_response(response, media_id=media_id)
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """
+        Build a keep-alive session with a bounded connection pool.
+
+        Failed connection attempts are retried for every method, since
+        nothing reached Instagram.  Read timeouts and gateway errors
+        (502/503/504) are retried for ``GET`` only: a ``POST`` may already
+        have created the comment, and re-sending it would publish a
+        duplicate under a new Instagram ID.  ``raise_on_status`` is disabled
+        so that the last response still flows through :meth:`_handle_response`.
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        return session
+
+    def _send(
+        self, method: Callable[..., requests.Response], url: str, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Perform one HTTP call under the adaptive limiter.
+
+        Raises:
+            InstagramRequestUncertainError: The request was sent but no
+                response arrived in time.
+            InstagramAPIError: On any other network-level failure.
+        """
+        with self._limiter.acquire():
+            started = time.monotonic()
+            try:
+                response = method(url, **kwargs)
+            except requests.ReadTimeout as exc:
+                self._limiter.observe(time.monotonic() - started, 0, {})
+                raise InstagramRequestUncertainError(
+                    f"Timed out waiting for Instagram API response: {exc}"
+                ) from exc
+            except requests.RequestException as exc:
+                self._limiter.observe(time.monotonic() - started, 0, {})
+                raise InstagramAPIError(
+                    f"Network error while calling Instagram API: {exc}"
+                ) from exc
+            self._limiter.observe(
+                time.monotonic() - started, response.status_code, response.headers
+            )
+        return response
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="instagram-client-loop",
+                    daemon=True,
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        """
+        Return the long-lived ``aiohttp`` session, creating it on first use.
+
+        Only called from coroutines running on the background loop, so the
+        session is always bound to that loop.
+        """
+        if self._aio_session is None:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=30,
+            )
+            self._aio_session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._aio_session
+
+    def _get_aio_gate(self) -> _AsyncGate:
+        """
+        Return the event-loop concurrency gate, creating it on first use.
+
+        Like the ``aiohttp`` session it is only touched from the background
+        loop, and it follows the same AIMD limit as the sync transport.
+        """
+        if self._aio_gate is None:
+            self._aio_gate = _AsyncGate(self._limiter)
+        return self._aio_gate
+
     def _handle_response(
         self, response: requests.Response, *, media_id: str
     ) -> dict[str, Any]:
@@ -109,7 +479,8 @@ class InstagramClient:
         Parse a Graph API response and raise typed exceptions on failure.
 
         The Graph API returns HTTP 200 even for business-logic errors and
-        embeds the error details inside ``response.json()["error"]``.
+        embeds the error details inside the body's ``"error"`` object.
+        The raw body bytes are decoded with ``orjson`` directly.
         This method normalises both transport-level and application-level
         errors into the same exception hierarchy.
 
@@ -125,16 +496,55 @@ class InstagramClient:
             InstagramAPIError:  For all other error conditions.
         """
         try:
-            data: dict[str, Any] = response.json()
-        except ValueError as exc:
-            raise InstagramAPIError(
-                f"Invalid JSON response from Instagram API (status={response.status_code})"
-            ) from exc
+            data: dict[str, Any] = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            raise self._invalid_json_error(response.status_code) from exc
+
+        return self._check_payload(
+            data,
+            ok=response.ok,
+            status_code=response.status_code,
+            text=response.text,
+            media_id=media_id,
+        )
+
+    @staticmethod
+    def _invalid_json_error(status_code: int) -> InstagramAPIError:
+        """
+        Build the error for a response body that is not JSON.
+
+        Only a client error (4xx) proves the request was rejected; a success
+        or a gateway page (typically 502/504) leaves the outcome unknown.
+        """
+        message = f"Invalid JSON response from Instagram API (status={status_code})"
+        if 400 <= status_code < 500:
+            return InstagramAPIError(message, status_code=status_code)
+        return InstagramRequestUncertainError(message, status_code=status_code)
+
+    @staticmethod
+    def _check_payload(
+        data: dict[str, Any], *, ok: bool, status_code: int, text: str, media_id: str
+    ) -> dict[str, Any]:
+        """
+        Raise typed exceptions for an already-decoded Graph API body.
 
-        if not response.ok or "error" in data:
+        Shared by the ``requests`` and ``aiohttp`` transports.
+
+        Raises:
+            MediaNotFoundError: When the API signals the media is missing.
+            InstagramRequestUncertainError: On a 5xx without a Graph error body.
+            InstagramAPIError:  For all other error conditions.
+        """
+        if not ok and "error" not in data and status_code >= 500:
+            raise InstagramRequestUncertainError(
+                f"Instagram API server error without details (status={status_code})",
+                status_code=status_code,
+            )
+
+        if not ok or "error" in data:
             error = data.get("error", {})
-            error_message: str = error.get("message", response.text)
-            error_code: int = error.get("code", response.status_code)
+            error_message: str = error.get("message", text)
+            error_code: int = error.get("code", status_code)
 
             # Instagram returns code 100 / subcode 33 for missing objects
             error_subcode: int = error.get("error_subcode", 0)
@@ -147,3 +557,14 @@ class InstagramClient:
             raise InstagramAPIError(error_message, status_code=error_code)
 
         return data
+
+
+_default_client: InstagramClient | None = None
+
+
+def get_instagram_client() -> InstagramClient:
+    """Return the process-wide :class:`InstagramClient`, creating it on first use."""
+    global _default_client
+    if _default_client is None:
+        _default_client = InstagramClient()
+    return _default_client
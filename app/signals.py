@@ -0,0 +1,25 @@
+"""Model signal handlers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from app.models import Post
+from app.services.comment_service import post_instagram_id_cache_key
+
+
+@receiver(post_delete, sender=Post)
+def forget_post_instagram_id(sender: type[Post], instance: Post, **kwargs: Any) -> None:
+    """
+    Drop the cached media ID of a deleted post once the delete commits.
+
+    Deleting earlier would let a concurrent request re-cache the ID from
+    the still-visible row; a rolled-back delete keeps the entry.
+    """
+    key = post_instagram_id_cache_key(instance.pk)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,53 @@
+"""
+Celery tasks.
+
+Tasks are thin wrappers around the service layer: they only deal with
+scheduling concerns (retries, backoff) and delegate the actual work to
+:class:`~app.services.CommentService`.
+"""
+
+from __future__ import annotations
+
+from celery import shared_task
+from celery.utils.time import get_exponential_backoff_interval
+
+from app.services import (
+    InstagramAPIError,
+    InstagramRequestUncertainError,
+    MediaNotFoundError,
+    get_comment_service,
+)
+
+MAX_RETRIES = 8
+
+
+@shared_task(bind=True, max_retries=MAX_RETRIES)
+def publish_comment(self, comment_id: int) -> None:
+    """
+    Publish a pending comment to Instagram.
+
+    Transient Instagram errors are retried with exponential backoff and
+    full jitter.  A missing media object, or exhausting all retries, marks
+    the comment as ``failed``.  A call whose outcome is unknown is never
+    retried, since the comment may already be live; the service has
+    already marked it ``failed`` for reconciliation.
+    """
+    service = get_comment_service()
+
+    try:
+        service.publish_pending_comment(comment_id)
+    except InstagramRequestUncertainError:
+        return
+    except MediaNotFoundError as exc:
+        service.mark_comment_failed(comment_id, str(exc))
+    except InstagramAPIError as exc:
+        if self.request.retries >= self.max_retries:
+            service.mark_comment_failed(comment_id, str(exc))
+            return
+        countdown = get_exponential_backoff_interval(
+            factor=1,
+            retries=self.request.retries,
+            maximum=600,
+            full_jitter=True,
+        )
+        raise self.retry(exc=exc, countdown=countdown)
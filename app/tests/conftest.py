@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from django.core.cache import cache
+
+from app.services import comment_service, instagram_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> Iterator[None]:
+    """Keep cached values (e.g. post media IDs) from leaking between tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_service_singletons(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Give each test fresh process-wide singletons.
+
+    ``CommentService`` reads settings such as ``CACHE_POST_INSTAGRAM_IDS``
+    once at construction, so a shared instance would carry one test's
+    ``settings`` overrides into the next.
+    """
+    monkeypatch.setattr(comment_service, "_default_service", None)
+    monkeypatch.setattr(instagram_client, "_default_client", None)
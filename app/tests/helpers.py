@@ -0,0 +1,47 @@
+"""Shared helpers for the test suite."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+
+# Graph API body for a comment on deleted media (code 100, subcode 33).
+MEDIA_NOT_FOUND_BODY: dict[str, Any] = {
+    "error": {
+        "message": "Invalid parameter",
+        "type": "OAuthException",
+        "code": 100,
+        "error_subcode": 33,
+        "fbtrace_id": "ABC123",
+    }
+}
+
+
+def graph_error_body(code: int, message: str) -> dict[str, Any]:
+    """Return a generic Graph API error body with the given ``code``."""
+    return {
+        "error": {
+            "message": message,
+            "type": "OAuthException",
+            "code": code,
+            "fbtrace_id": "XYZ789",
+        }
+    }
+
+
+def mock_response(status_code: int, body: dict[str, Any]) -> SimpleNamespace:
+    """
+    Return a lightweight stand-in for ``requests.Response``.
+
+    Only the attributes ``InstagramClient`` reads are provided; the body is
+    exposed as raw ``content`` bytes, exactly as the client decodes it.
+    """
+    return SimpleNamespace(
+        ok=status_code < 400,
+        status_code=status_code,
+        headers={},
+        content=orjson.dumps(body),
+        text="",
+    )
@@ -13,8 +13,9 @@ Test scenarios:
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from django.urls import reverse
@@ -22,6 +23,8 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 from app.models import Comment, Post
+from app.serializers import CommentSerializer
+from app.tests import helpers
 
 
 # ---------------------------------------------------------------------------
@@ -76,7 +79,7 @@ class TestCreateCommentSuccess:
         mock_response: dict[str, Any] = {"id": INSTAGRAM_COMMENT_ID}
 
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_ok_response(mock_response),
         ):
             response = api_client.post(
@@ -91,6 +94,25 @@ class TestCreateCommentSuccess:
         assert data["instagram_comment_id"] == INSTAGRAM_COMMENT_ID
         assert data["post"] == post.pk
 
+    def test_response_matches_comment_serializer(
+        self, api_client: APIClient, post: Post
+    ) -> None:
+        """The hand-built 201 body must match ``CommentSerializer`` output."""
+        mock_response: dict[str, Any] = {"id": INSTAGRAM_COMMENT_ID}
+
+        with patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=_mock_ok_response(mock_response),
+        ):
+            response = api_client.post(
+                _url(post.pk),
+                {"text": "Same shape"},
+                format="json",
+            )
+
+        comment = Comment.objects.get()
+        assert response.json() == CommentSerializer(comment).data
+
     def test_comment_record_is_saved_to_database(
         self, api_client: APIClient, post: Post
     ) -> None:
@@ -100,7 +122,7 @@ class TestCreateCommentSuccess:
         assert Comment.objects.count() == 0
 
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_ok_response(mock_response),
         ):
             api_client.post(
@@ -123,7 +145,7 @@ class TestCreateCommentSuccess:
         mock_response: dict[str, Any] = {"id": INSTAGRAM_COMMENT_ID}
 
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_ok_response(mock_response),
         ) as mock_post:
             api_client.post(
@@ -148,7 +170,7 @@ class TestCreateCommentPostNotFound:
         """Response status must be 404."""
         non_existent_post_id = 9999
 
-        with patch("app.services.instagram_client.requests.post") as mock_post:
+        with patch("app.services.instagram_client.requests.Session.post") as mock_post:
             response = api_client.post(
                 _url(non_existent_post_id),
                 {"text": "Hello"},
@@ -162,7 +184,7 @@ class TestCreateCommentPostNotFound:
         """Response body must contain a meaningful error message."""
         non_existent_post_id = 9999
 
-        with patch("app.services.instagram_client.requests.post"):
+        with patch("app.services.instagram_client.requests.Session.post"):
             response = api_client.post(
                 _url(non_existent_post_id),
                 {"text": "Hello"},
@@ -173,7 +195,7 @@ class TestCreateCommentPostNotFound:
 
     def test_no_comment_created_in_db(self, api_client: APIClient) -> None:
         """No Comment row must be written when the post is missing."""
-        with patch("app.services.instagram_client.requests.post"):
+        with patch("app.services.instagram_client.requests.Session.post"):
             api_client.post(
                 _url(9999),
                 {"text": "Nothing should be saved"},
@@ -197,7 +219,7 @@ class TestCreateCommentMediaDeletedOnInstagram:
     ) -> None:
         """Response status must be 404."""
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_media_not_found_response(),
         ):
             response = api_client.post(
@@ -213,7 +235,7 @@ class TestCreateCommentMediaDeletedOnInstagram:
     ) -> None:
         """Response body must include a ``detail`` key with an error description."""
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_media_not_found_response(),
         ):
             response = api_client.post(
@@ -231,7 +253,7 @@ class TestCreateCommentMediaDeletedOnInstagram:
     ) -> None:
         """A Comment row must NOT be persisted when the API signals the media is gone."""
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_media_not_found_response(),
         ):
             api_client.post(
@@ -251,7 +273,7 @@ class TestCreateCommentValidation:
         self, api_client: APIClient, post: Post
     ) -> None:
         """Missing ``text`` field must yield 400."""
-        with patch("app.services.instagram_client.requests.post"):
+        with patch("app.services.instagram_client.requests.Session.post"):
             response = api_client.post(_url(post.pk), {}, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -260,7 +282,7 @@ class TestCreateCommentValidation:
         self, api_client: APIClient, post: Post
     ) -> None:
         """Empty string must be rejected."""
-        with patch("app.services.instagram_client.requests.post"):
+        with patch("app.services.instagram_client.requests.Session.post"):
             response = api_client.post(
                 _url(post.pk), {"text": ""}, format="json"
             )
@@ -272,7 +294,7 @@ class TestCreateCommentValidation:
     ) -> None:
         """Unexpected Instagram API errors must yield 502 Bad Gateway."""
         with patch(
-            "app.services.instagram_client.requests.post",
+            "app.services.instagram_client.requests.Session.post",
             return_value=_mock_instagram_error_response(
                 code=10, message="Application does not have permission"
             ),
@@ -283,51 +305,42 @@ class TestCreateCommentValidation:
 
         assert response.status_code == status.HTTP_502_BAD_GATEWAY
 
+    def test_returns_502_on_non_json_instagram_response(
+        self, api_client: APIClient, post: Post
+    ) -> None:
+        """A body that is not JSON (e.g. an HTML error page) must yield 502."""
+        mock = _mock_ok_response({})
+        mock.content = b"<html>Bad Gateway</html>"
+
+        with patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=mock,
+        ):
+            response = api_client.post(
+                _url(post.pk), {"text": "Hello"}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_502_BAD_GATEWAY
+        assert Comment.objects.count() == 0
+
 
 # ---------------------------------------------------------------------------
 # Mock response factories
 # ---------------------------------------------------------------------------
 
-def _mock_ok_response(body: dict[str, Any]) -> MagicMock:
+def _mock_ok_response(body: dict[str, Any]) -> SimpleNamespace:
     """Return a mock that looks like a successful ``requests.Response``."""
-    mock = MagicMock()
-    mock.ok = True
-    mock.status_code = 200
-    mock.json.return_value = body
-    return mock
+    return helpers.mock_response(200, body)
 
 
-def _mock_media_not_found_response() -> MagicMock:
+def _mock_media_not_found_response() -> SimpleNamespace:
     """
     Return a mock that simulates the Instagram API's response when a
     media object has been deleted (code=100, error_subcode=33).
     """
-    mock = MagicMock()
-    mock.ok = False
-    mock.status_code = 400
-    mock.json.return_value = {
-        "error": {
-            "message": "Invalid parameter",
-            "type": "OAuthException",
-            "code": 100,
-            "error_subcode": 33,
-            "fbtrace_id": "ABC123",
-        }
-    }
-    return mock
-
-
-def _mock_instagram_error_response(code: int, message: str) -> MagicMock:
+    return helpers.mock_response(400, helpers.MEDIA_NOT_FOUND_BODY)
+
+
+def _mock_instagram_error_response(code: int, message: str) -> SimpleNamespace:
     """Return a generic Instagram API error mock."""
-    mock = MagicMock()
-    mock.ok = False
-    mock.status_code = 400
-    mock.json.return_value = {
-        "error": {
-            "message": message,
-            "type": "OAuthException",
-            "code": code,
-            "fbtrace_id": "XYZ789",
-        }
-    }
-    return mock
+    return helpers.mock_response(400, helpers.graph_error_body(code, message))
@@ -0,0 +1,157 @@
+"""
+Tests for the background comment-publishing flow.
+
+Covers the async mode of POST /api/posts/{id}/comments/ (pending row +
+queued task) and the ``publish_comment`` Celery task itself.  The task
+is invoked eagerly via ``.apply()``; only the Instagram HTTP call is mocked.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+import requests
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from app.models import Comment, Post
+from app.tasks import MAX_RETRIES, publish_comment
+from app.tests.helpers import MEDIA_NOT_FOUND_BODY, graph_error_body, mock_response
+
+INSTAGRAM_COMMENT_ID = "17858893269000001"
+INSTAGRAM_MEDIA_ID = "17896129349000001"
+
+
+@pytest.fixture()
+def post(db) -> Post:
+    """A Post that exists in the test database."""
+    return Post.objects.create(instagram_id=INSTAGRAM_MEDIA_ID, caption="Test caption")
+
+
+@pytest.fixture()
+def pending_comment(post: Post) -> Comment:
+    """A comment waiting to be published."""
+    return Comment.objects.create(post=post, text="Queued", status=Comment.Status.PENDING)
+
+
+@pytest.mark.django_db
+class TestAsyncCommentCreate:
+    """With ``INSTAGRAM_PUBLISH_ASYNC`` the view queues instead of publishing."""
+
+    def test_returns_202_and_queues_task(
+        self, settings, post: Post, django_capture_on_commit_callbacks
+    ) -> None:
+        """A pending row is saved and the task is dispatched after commit."""
+        settings.INSTAGRAM_PUBLISH_ASYNC = True
+
+        with patch("app.tasks.publish_comment.delay") as mock_delay, \
+                patch("app.services.instagram_client.requests.Session.post") as mock_post:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = APIClient().post(
+                    reverse("comment-create", kwargs={"post_id": post.pk}),
+                    {"text": "Later"},
+                    format="json",
+                )
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["status"] == Comment.Status.PENDING
+        comment = Comment.objects.get()
+        mock_delay.assert_called_once_with(comment.pk)
+        mock_post.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestPublishCommentTask:
+    """The task publishes pending comments and records failures."""
+
+    def test_marks_comment_published(self, pending_comment: Comment) -> None:
+        """A successful API call stores the Instagram ID."""
+        with patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=mock_response(200, {"id": INSTAGRAM_COMMENT_ID}),
+        ):
+            publish_comment.apply(args=[pending_comment.pk])
+
+        pending_comment.refresh_from_db()
+        assert pending_comment.status == Comment.Status.PUBLISHED
+        assert pending_comment.instagram_comment_id == INSTAGRAM_COMMENT_ID
+
+    def test_marks_comment_failed_when_media_deleted(self, pending_comment: Comment) -> None:
+        """Missing media is permanent — no retry, comment is marked failed."""
+        with patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=mock_response(400, MEDIA_NOT_FOUND_BODY),
+        ) as mock_post:
+            publish_comment.apply(args=[pending_comment.pk])
+
+        pending_comment.refresh_from_db()
+        assert pending_comment.status == Comment.Status.FAILED
+        assert pending_comment.error
+        mock_post.assert_called_once()
+
+    def test_transient_error_is_retried(self, pending_comment: Comment) -> None:
+        """A generic API error schedules a retry, which then publishes."""
+        error = mock_response(400, graph_error_body(2, "Service unavailable"))
+        ok = mock_response(200, {"id": INSTAGRAM_COMMENT_ID})
+        with patch("app.tasks.get_exponential_backoff_interval", return_value=0), patch(
+            "app.services.instagram_client.requests.Session.post",
+            side_effect=[error, ok],
+        ) as mock_post:
+            publish_comment.apply(args=[pending_comment.pk])
+
+        pending_comment.refresh_from_db()
+        assert pending_comment.status == Comment.Status.PUBLISHED
+        assert mock_post.call_count == 2
+
+    def test_read_timeout_is_not_retried(self, pending_comment: Comment) -> None:
+        """A POST that may have reached Instagram is never re-sent."""
+        ok = mock_response(200, {"id": INSTAGRAM_COMMENT_ID})
+        with patch("app.tasks.get_exponential_backoff_interval", return_value=0), patch(
+            "app.services.instagram_client.requests.Session.post",
+            side_effect=[requests.ReadTimeout("read timed out"), ok],
+        ) as mock_post:
+            publish_comment.apply(args=[pending_comment.pk])
+
+        pending_comment.refresh_from_db()
+        assert pending_comment.status == Comment.Status.FAILED
+        assert "Timed out" in pending_comment.error
+        assert mock_post.call_count == 1
+
+    def test_marks_comment_failed_after_max_retries(self, pending_comment: Comment) -> None:
+        """Once ``MAX_RETRIES`` retries are used up the comment is failed."""
+        error = mock_response(400, graph_error_body(2, "Service unavailable"))
+        with patch("app.tasks.get_exponential_backoff_interval", return_value=0), patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=error,
+        ) as mock_post:
+            publish_comment.apply(args=[pending_comment.pk])
+
+        pending_comment.refresh_from_db()
+        assert pending_comment.status == Comment.Status.FAILED
+        assert pending_comment.error == "Service unavailable"
+        assert mock_post.call_count == MAX_RETRIES + 1
+
+    @pytest.mark.parametrize(
+        "comment_status",
+        [Comment.Status.PUBLISHING, Comment.Status.PUBLISHED, Comment.Status.FAILED],
+    )
+    def test_non_pending_comment_is_left_alone(self, post: Post, comment_status: str) -> None:
+        """Already handled comments are not published again."""
+        comment = Comment.objects.create(
+            post=post, instagram_comment_id="c1", text="Done", status=comment_status
+        )
+        with patch("app.services.instagram_client.requests.Session.post") as mock_post:
+            publish_comment.apply(args=[comment.pk])
+
+        comment.refresh_from_db()
+        assert comment.status == comment_status
+        mock_post.assert_not_called()
+
+    def test_missing_comment_is_a_no_op(self, db) -> None:
+        with patch("app.services.instagram_client.requests.Session.post") as mock_post:
+            result = publish_comment.apply(args=[9999])
+
+        assert result.successful()
+        mock_post.assert_not_called()
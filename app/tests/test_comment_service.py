@@ -0,0 +1,233 @@
+"""
+Service-level tests for ``CommentService``.
+
+Covers behaviour not visible through the HTTP endpoint (bulk creation,
+lookup caching).  A mock ``InstagramClient`` is injected; the database
+is real.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from app.models import Comment, Post
+from app.services import CommentService, MediaNotFoundError, PostNotFoundError
+from app.services.comment_service import post_instagram_id_cache_key
+
+INSTAGRAM_MEDIA_ID = "17896129349000001"
+
+
+@pytest.fixture()
+def post(db) -> Post:
+    """A Post that exists in the test database."""
+    return Post.objects.create(instagram_id=INSTAGRAM_MEDIA_ID)
+
+
+@pytest.mark.django_db
+class TestCreateCommentsBulk:
+    """``create_comments_bulk`` publishes concurrently and saves in one batch."""
+
+    def test_saves_every_accepted_comment(self, post: Post) -> None:
+        """One lookup plus one batched INSERT, regardless of the number of texts."""
+        client = MagicMock()
+        client.create_comments.return_value = [{"id": "c1"}, {"id": "c2"}, {"id": "c3"}]
+
+        with CaptureQueriesContext(connection) as ctx:
+            results = CommentService(client).create_comments_bulk(post.pk, ["a", "b", "c"])
+
+        sql = [q["sql"] for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]]
+        assert len(sql) == 2
+        assert sql[1].startswith('INSERT INTO "comments"')
+
+        client.create_comments.assert_called_once_with(INSTAGRAM_MEDIA_ID, ["a", "b", "c"])
+        assert [r.instagram_comment_id for r in results] == ["c1", "c2", "c3"]
+        assert sorted(Comment.objects.values_list("text", flat=True)) == ["a", "b", "c"]
+
+    def test_failed_messages_are_returned_and_not_saved(self, post: Post) -> None:
+        """API errors are passed through in place; the rest are still saved."""
+        error = MediaNotFoundError("gone", status_code=404)
+        client = MagicMock()
+        client.create_comments.return_value = [{"id": "c1"}, error]
+
+        results = CommentService(client).create_comments_bulk(post.pk, ["ok", "bad"])
+
+        assert isinstance(results[0], Comment)
+        assert results[1] is error
+        assert list(Comment.objects.values_list("text", flat=True)) == ["ok"]
+
+    def test_raises_when_post_missing(self, db) -> None:
+        client = MagicMock()
+
+        with pytest.raises(PostNotFoundError):
+            CommentService(client).create_comments_bulk(9999, ["a"])
+
+        client.create_comments.assert_not_called()
+
+    def test_already_saved_comments_are_returned_not_duplicated(self, post: Post) -> None:
+        """A retried batch falls back to row-by-row saves and keeps existing rows."""
+        existing = Comment.objects.create(post=post, instagram_comment_id="c1", text="a")
+        client = MagicMock()
+        client.create_comments.return_value = [{"id": "c1"}, {"id": "c2"}]
+
+        results = CommentService(client).create_comments_bulk(post.pk, ["a", "b"])
+
+        assert results[0].pk == existing.pk
+        assert results[1].instagram_comment_id == "c2"
+        assert sorted(Comment.objects.values_list("instagram_comment_id", flat=True)) == [
+            "c1",
+            "c2",
+        ]
+
+
+@pytest.mark.django_db
+class TestCreateCommentIdempotency:
+    """Retried publishes do not insert duplicate rows."""
+
+    def test_same_instagram_comment_returns_existing_row(self, post: Post) -> None:
+        client = MagicMock()
+        client.create_comment.return_value = {"id": "c1"}
+        service = CommentService(client)
+
+        first = service.create_comment(post.pk, "Hello")
+        second = service.create_comment(post.pk, "Hello")
+
+        assert second.pk == first.pk
+        assert Comment.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCreateCommentIntegrityErrors:
+    """A failed insert that is not a duplicate is never reported as success."""
+
+    def test_post_deleted_meanwhile_is_not_found(self, settings, post: Post) -> None:
+        """A post deleted while its media ID is still cached is reported missing."""
+        settings.CACHE_POST_INSTAGRAM_IDS = True
+        client = MagicMock()
+        client.create_comment.return_value = {"id": "c1"}
+        service = CommentService(client)
+        post_id = post.pk
+        Post.objects.filter(pk=post_id).delete()
+        # Simulate another worker's cache that never saw the delete
+        cache.set(post_instagram_id_cache_key(post_id), INSTAGRAM_MEDIA_ID)
+
+        with pytest.raises(PostNotFoundError):
+            service.create_comment(post_id, "Orphan")
+
+        assert Comment.objects.count() == 0
+        assert cache.get(post_instagram_id_cache_key(post_id)) is None
+
+
+@pytest.mark.django_db
+class TestInstagramIdCache:
+    """The post → media ID lookup is cached and invalidated on delete."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_cache(self, settings) -> None:
+        settings.CACHE_POST_INSTAGRAM_IDS = True
+
+    def test_second_create_skips_post_lookup(self, post: Post) -> None:
+        """The posts table is not queried once the media ID is cached."""
+        client = MagicMock()
+        client.create_comment.return_value = {"id": "c1"}
+        service = CommentService(client)
+        service.create_comment(post.pk, "first")
+        client.create_comment.return_value = {"id": "c2"}
+
+        with CaptureQueriesContext(connection) as ctx:
+            service.create_comment(post.pk, "second")
+
+        assert not [q for q in ctx.captured_queries if '"posts"' in q["sql"]]
+        assert client.create_comment.call_args.kwargs["media_id"] == INSTAGRAM_MEDIA_ID
+
+    def test_deleting_post_invalidates_cache(
+        self, post: Post, django_capture_on_commit_callbacks
+    ) -> None:
+        client = MagicMock()
+        client.create_comment.return_value = {"id": "c1"}
+        service = CommentService(client)
+        service.create_comment(post.pk, "first")
+        post_id = post.pk
+
+        with django_capture_on_commit_callbacks(execute=True):
+            post.delete()
+
+        with pytest.raises(PostNotFoundError):
+            service.create_comment(post_id, "after delete")
+
+    def test_lookup_is_not_cached_when_disabled(self, settings, post: Post) -> None:
+        """Without a shared cache every create reads the post from the DB."""
+        settings.CACHE_POST_INSTAGRAM_IDS = False
+        client = MagicMock()
+        client.create_comment.return_value = {"id": "c1"}
+        service = CommentService(client)
+        service.create_comment(post.pk, "first")
+        client.create_comment.return_value = {"id": "c2"}
+
+        with CaptureQueriesContext(connection) as ctx:
+            service.create_comment(post.pk, "second")
+
+        assert [q for q in ctx.captured_queries if '"posts"' in q["sql"]]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPublishPendingComment:
+    """The pending-comment claim keeps the Instagram call out of transactions."""
+
+    def test_instagram_call_runs_outside_transaction(self, post: Post) -> None:
+        comment = Comment.objects.create(post=post, text="Queued", status=Comment.Status.PENDING)
+        seen: dict[str, object] = {}
+
+        def fake_create(media_id: str, message: str) -> dict[str, str]:
+            seen["in_atomic_block"] = connection.in_atomic_block
+            seen["status"] = Comment.objects.get(pk=comment.pk).status
+            return {"id": "c1"}
+
+        client = MagicMock()
+        client.create_comment.side_effect = fake_create
+
+        CommentService(client).publish_pending_comment(comment.pk)
+
+        assert seen == {"in_atomic_block": False, "status": Comment.Status.PUBLISHING}
+        comment.refresh_from_db()
+        assert comment.status == Comment.Status.PUBLISHED
+
+    def test_failed_call_releases_claim(self, post: Post) -> None:
+        """An API error puts the comment back to ``pending`` for a retry."""
+        comment = Comment.objects.create(post=post, text="Queued", status=Comment.Status.PENDING)
+        client = MagicMock()
+        client.create_comment.side_effect = MediaNotFoundError("gone", status_code=404)
+
+        with pytest.raises(MediaNotFoundError):
+            CommentService(client).publish_pending_comment(comment.pk)
+
+        comment.refresh_from_db()
+        assert comment.status == Comment.Status.PENDING
+
+    def test_unexpected_error_marks_comment_failed(self, post: Post) -> None:
+        """Errors other than API errors do not leave the comment ``publishing``."""
+        comment = Comment.objects.create(post=post, text="Queued", status=Comment.Status.PENDING)
+        client = MagicMock()
+        client.create_comment.return_value = {}
+
+        with pytest.raises(KeyError):
+            CommentService(client).publish_pending_comment(comment.pk)
+
+        comment.refresh_from_db()
+        assert comment.status == Comment.Status.FAILED
+        assert "KeyError" in comment.error
+
+    def test_mark_failed_accepts_publishing_comment(self, post: Post) -> None:
+        comment = Comment.objects.create(
+            post=post, text="Queued", status=Comment.Status.PUBLISHING
+        )
+
+        CommentService(MagicMock()).mark_comment_failed(comment.pk, "worker lost")
+
+        comment.refresh_from_db()
+        assert comment.status == Comment.Status.FAILED
+        assert comment.error == "worker lost"
@@ -0,0 +1,326 @@
+"""
+Unit tests for the Instagram client.
+
+Covers the adaptive rate limiter, the session retry policy and the
+``aiohttp`` transport.  The async path is exercised against a local
+``aiohttp`` server standing in for the Graph API; no database access is made.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import requests
+from aiohttp import web
+
+from app.services.instagram_client import (
+    InstagramAPIError,
+    InstagramClient,
+    InstagramRequestUncertainError,
+    MediaNotFoundError,
+    _AsyncGate,
+    _Limiter,
+)
+from app.tests.helpers import MEDIA_NOT_FOUND_BODY, graph_error_body, mock_response
+
+
+class TestLimiter:
+    """AIMD behaviour of the concurrency limiter."""
+
+    def test_fast_success_increases_limit_additively(self) -> None:
+        """Latency under target grows the limit by 0.5 per call."""
+        limiter = _Limiter(initial=4, target_latency=1.0)
+
+        limiter.observe(0.1, 200, {})
+
+        assert limiter.limit == 4.5
+
+    def test_limit_never_exceeds_maximum(self) -> None:
+        limiter = _Limiter(initial=4, maximum=4)
+
+        limiter.observe(0.1, 200, {})
+
+        assert limiter.limit == 4
+
+    def test_throttled_response_halves_limit(self) -> None:
+        """A 429 halves the limit."""
+        limiter = _Limiter(initial=8)
+
+        limiter.observe(0.1, 429, {})
+
+        assert limiter.limit == 4
+
+    def test_slow_responses_halve_limit(self) -> None:
+        """Mean latency over the target triggers a multiplicative decrease."""
+        limiter = _Limiter(initial=8, target_latency=0.5)
+
+        limiter.observe(2.0, 200, {})
+
+        assert limiter.limit == 4
+
+    def test_limit_never_drops_below_minimum(self) -> None:
+        limiter = _Limiter(initial=1, minimum=1)
+
+        limiter.observe(0.1, 503, {})
+
+        assert limiter.limit == 1
+
+    def test_exhausted_rate_limit_header_halves_limit(self) -> None:
+        limiter = _Limiter(initial=8)
+
+        limiter.observe(0.1, 200, {"X-RateLimit-Remaining-Requests": "0"})
+
+        assert limiter.limit == 4
+
+    def test_retry_after_delays_next_acquire(self) -> None:
+        """``Retry-After`` blocks new calls until it elapses."""
+        limiter = _Limiter()
+        limiter.observe(0.1, 429, {"Retry-After": "0.2"})
+
+        started = time.monotonic()
+        with limiter.acquire():
+            pass
+
+        assert time.monotonic() - started >= 0.15
+
+    def test_retry_after_is_capped(self) -> None:
+        limiter = _Limiter()
+
+        limiter.observe(0.1, 429, {"Retry-After": "86400"})
+
+        assert limiter.backoff_remaining() <= _Limiter.MAX_BACKOFF
+
+    def test_burst_of_failures_halves_limit_once(self) -> None:
+        """Failures from calls started before a decrease do not compound it."""
+        limiter = _Limiter(initial=8)
+
+        for _ in range(3):
+            limiter.observe(0.1, 429, {})
+        assert limiter.limit == 4
+
+        time.sleep(0.02)
+        limiter.observe(0.01, 429, {})
+        assert limiter.limit == 2
+
+    def test_acquire_times_out_when_saturated(self) -> None:
+        limiter = _Limiter(initial=1)
+
+        with limiter.acquire(), pytest.raises(InstagramAPIError, match="capacity"):
+            with limiter.acquire(timeout=0.05):
+                pass
+
+    def test_acquire_fails_fast_when_backoff_outlasts_timeout(self) -> None:
+        limiter = _Limiter()
+        limiter.observe(0.1, 429, {"Retry-After": "30"})
+
+        started = time.monotonic()
+        with pytest.raises(InstagramAPIError, match="capacity"):
+            with limiter.acquire(timeout=1):
+                pass
+
+        assert time.monotonic() - started < 0.5
+
+    def test_async_gate_times_out_when_saturated(self) -> None:
+        async def scenario() -> None:
+            gate = _AsyncGate(_Limiter(initial=1))
+            async with gate.acquire():
+                async with gate.acquire(timeout=0.05):
+                    pass
+
+        with pytest.raises(InstagramAPIError, match="capacity"):
+            asyncio.run(scenario())
+
+
+class TestSessionRetries:
+    """The pooled session must never re-send a comment POST."""
+
+    def test_post_is_not_retried_on_gateway_errors(self) -> None:
+        retry = InstagramClient(access_token="token")._session.get_adapter("https://x").max_retries
+
+        assert not retry.is_retry("POST", 502)
+        assert retry.is_retry("GET", 502)
+
+
+class TestUncertainOutcome:
+    """Failures that may hide a created comment are reported as such."""
+
+    @pytest.mark.parametrize(
+        "outcome",
+        [requests.ReadTimeout("read timed out"), mock_response(503, {})],
+        ids=["read-timeout", "5xx-without-error-body"],
+    )
+    def test_unknown_outcome_is_uncertain(self, outcome: Any) -> None:
+        client = InstagramClient(access_token="token")
+        with patch(
+            "app.services.instagram_client.requests.Session.post", side_effect=[outcome]
+        ), pytest.raises(InstagramRequestUncertainError):
+            client.create_comment("media", "Hi")
+
+    def test_graph_error_is_definite(self) -> None:
+        """A parsed Graph API error proves the comment was not created."""
+        client = InstagramClient(access_token="token")
+        with patch(
+            "app.services.instagram_client.requests.Session.post",
+            return_value=mock_response(500, graph_error_body(2, "Service unavailable")),
+        ), pytest.raises(InstagramAPIError) as exc_info:
+            client.create_comment("media", "Hi")
+
+        assert not isinstance(exc_info.value, InstagramRequestUncertainError)
+
+
+class TestCreateComments:
+    """``create_comments`` runs the async calls concurrently from sync code."""
+
+    def test_returns_results_in_input_order(self) -> None:
+        """Each message maps to its own API response, in order."""
+        async def fake_create(media_id: str, message: str) -> dict[str, Any]:
+            await asyncio.sleep(0.01 if message == "first" else 0)
+            return {"id": f"{media_id}-{message}"}
+
+        client = InstagramClient(access_token="token")
+        with patch.object(client, "async_create_comment", side_effect=fake_create):
+            results = client.create_comments("media", ["first", "second"])
+
+        assert results == [{"id": "media-first"}, {"id": "media-second"}]
+
+    def test_api_errors_are_returned_not_raised(self) -> None:
+        """One failing message does not discard the others' results."""
+        async def fake_create(media_id: str, message: str) -> dict[str, Any]:
+            if message == "bad":
+                raise MediaNotFoundError("gone", status_code=404)
+            return {"id": message}
+
+        client = InstagramClient(access_token="token")
+        with patch.object(client, "async_create_comment", side_effect=fake_create):
+            ok, failed = client.create_comments("media", ["ok", "bad"])
+
+        assert ok == {"id": "ok"}
+        assert isinstance(failed, InstagramAPIError)
+
+
+class _FakeGraphAPI:
+    """
+    Minimal Graph API stand-in served by ``aiohttp.web`` on a thread.
+
+    The media ID in the URL selects the behaviour; peak concurrency of
+    ``slow`` requests is recorded so the client's gate can be checked.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.base_url = ""
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        media_id = request.match_info["media_id"]
+        body = await request.json()
+        if media_id == "gone":
+            return web.json_response(MEDIA_NOT_FOUND_BODY, status=400)
+        if media_id == "html":
+            return web.Response(text="<html>Bad Gateway</html>", status=502)
+        if media_id == "throttled":
+            return web.json_response(graph_error_body(4, "Too many calls"), status=429)
+        if media_id == "slow":
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+        return web.json_response({"id": body["message"]})
+
+    def start(self) -> None:
+        started = threading.Event()
+
+        def serve() -> None:
+            loop = asyncio.new_event_loop()
+            app = web.Application()
+            app.router.add_post("/{media_id}/comments", self.handle)
+            runner = web.AppRunner(app)
+            loop.run_until_complete(runner.setup())
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            loop.run_until_complete(site.start())
+            port = site._server.sockets[0].getsockname()[1]
+            self.base_url = f"http://127.0.0.1:{port}"
+            started.set()
+            loop.run_forever()
+
+        threading.Thread(target=serve, daemon=True).start()
+        started.wait(timeout=5)
+
+
+@pytest.fixture(scope="module")
+def graph_api() -> Iterator[_FakeGraphAPI]:
+    """A running fake Graph API shared by the tests in this module."""
+    server = _FakeGraphAPI()
+    server.start()
+    yield server
+
+
+@pytest.fixture()
+def async_client(graph_api: _FakeGraphAPI) -> InstagramClient:
+    """A client pointed at the fake Graph API."""
+    client = InstagramClient(access_token="token")
+    client._base_url = graph_api.base_url
+    return client
+
+
+class TestAiohttpTransport:
+    """The real ``aiohttp`` path: decoding, error mapping and limiter feedback."""
+
+    def test_decodes_successful_responses(self, async_client: InstagramClient) -> None:
+        assert async_client.create_comments("ok", ["a", "b"]) == [{"id": "a"}, {"id": "b"}]
+
+    def test_maps_missing_media_to_media_not_found(self, async_client: InstagramClient) -> None:
+        [result] = async_client.create_comments("gone", ["a"])
+
+        assert isinstance(result, MediaNotFoundError)
+        assert result.status_code == 404
+
+    def test_gateway_page_is_an_uncertain_error(self, async_client: InstagramClient) -> None:
+        """A non-JSON 502 does not prove the comment was rejected."""
+        [result] = async_client.create_comments("html", ["a"])
+
+        assert isinstance(result, InstagramRequestUncertainError)
+        assert "Invalid JSON" in str(result)
+
+    def test_throttling_halves_the_limit(self, async_client: InstagramClient) -> None:
+        async_client._limiter.limit = 8
+
+        [result] = async_client.create_comments("throttled", ["a"])
+
+        assert isinstance(result, InstagramAPIError)
+        assert async_client._limiter.limit == 4
+
+    def test_network_error_is_an_api_error(self) -> None:
+        """A refused connection is reported to the limiter and raised as an API error."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = InstagramClient(access_token="token")
+        client._base_url = f"http://127.0.0.1:{port}"
+        client._limiter.limit = 8
+
+        [result] = client.create_comments("ok", ["a"])
+
+        assert isinstance(result, InstagramAPIError)
+        assert not isinstance(result, InstagramRequestUncertainError)
+        assert "Network error" in str(result)
+        assert client._limiter.limit == 4
+
+    def test_concurrency_follows_limiter(
+        self, graph_api: _FakeGraphAPI, async_client: InstagramClient
+    ) -> None:
+        """No more calls are in flight than the AIMD limit allows."""
+        async_client._limiter = _Limiter(initial=2, maximum=2)
+        graph_api.max_in_flight = 0
+
+        results = async_client.create_comments("slow", [str(i) for i in range(6)])
+
+        assert [r["id"] for r in results] == [str(i) for i in range(6)]
+        assert graph_api.max_in_flight == 2
@@ -0,0 +1,55 @@
+"""
+Tests for the ``orjson``-backed DRF renderer and parser.
+"""
+
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ParseError
+
+from app.parsers import ORJSONParser
+from app.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Rendering matches DRF's JSON output for the types we return."""
+
+    def test_renders_none_as_empty_body(self) -> None:
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_falls_back_to_drf_encoder(self) -> None:
+        """Types orjson does not know (e.g. ``Decimal``) use DRF's encoder."""
+        assert ORJSONRenderer().render({"n": Decimal("1.5")}) == b'{"n":1.5}'
+
+    def test_stringifies_non_str_keys(self) -> None:
+        """DRF keys nested list errors by index, as ``json.dumps`` allows."""
+        data = {"items": {0: ["This field is required."]}}
+        assert ORJSONRenderer().render(data) == b'{"items":{"0":["This field is required."]}}'
+
+
+class TestORJSONParser:
+    """Parsing request bodies."""
+
+    def test_parses_utf8_body(self) -> None:
+        stream = io.BytesIO('{"text": "Привет"}'.encode())
+
+        assert ORJSONParser().parse(stream) == {"text": "Привет"}
+
+    def test_decodes_declared_non_utf8_charset(self) -> None:
+        """A body in another declared charset is decoded with that charset."""
+        stream = io.BytesIO('{"text": "café"}'.encode("latin-1"))
+
+        assert ORJSONParser().parse(stream, parser_context={"encoding": "latin-1"}) == {
+            "text": "café",
+        }
+
+    def test_unknown_charset_raises_parse_error(self) -> None:
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{}"), parser_context={"encoding": "no-such-codec"})
+
+    def test_malformed_body_raises_parse_error(self) -> None:
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b"{not json"))
@@ -0,0 +1,56 @@
+"""
+Tests for the custom model querysets.
+
+Checks that the eager-loading helpers collapse related-object access
+into a fixed number of queries regardless of how many rows are loaded.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.models import Comment, Post
+
+
+@pytest.fixture()
+def posts_with_comments(db) -> list[Post]:
+    """Three posts with two comments each."""
+    posts = [
+        Post.objects.create(instagram_id=f"1789612934900000{i}") for i in range(3)
+    ]
+    for post in posts:
+        for n in range(2):
+            Comment.objects.create(
+                post=post,
+                instagram_comment_id=f"{post.instagram_id}{n}",
+                text=f"Comment {n}",
+            )
+    return posts
+
+
+@pytest.mark.django_db
+class TestCommentQuerySet:
+    """``Comment.objects.with_post()`` joins the parent post."""
+
+    def test_with_post_uses_single_query(
+        self, posts_with_comments: list[Post], django_assert_num_queries
+    ) -> None:
+        """Accessing ``comment.post`` must not issue follow-up queries."""
+        with django_assert_num_queries(1):
+            media_ids = [c.post.instagram_id for c in Comment.objects.with_post()]
+
+        assert len(media_ids) == 6
+
+
+@pytest.mark.django_db
+class TestPostQuerySet:
+    """``Post.objects.with_comments()`` prefetches comments."""
+
+    def test_with_comments_uses_two_queries(
+        self, posts_with_comments: list[Post], django_assert_num_queries
+    ) -> None:
+        """One query for posts plus one for all of their comments."""
+        with django_assert_num_queries(2):
+            counts = [len(p.comments.all()) for p in Post.objects.with_comments()]
+
+        assert counts == [2, 2, 2]
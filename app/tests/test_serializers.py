@@ -0,0 +1,62 @@
+"""
+Tests for request validation helpers.
+
+``validate_comment_text`` replaces ``CreateCommentSerializer`` on the hot
+path, so its results and error messages are checked against the
+serializer for a range of bodies.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from rest_framework.exceptions import ValidationError
+
+from app.models import Comment, Post
+from app.serializers import CommentSerializer, CreateCommentSerializer, validate_comment_text
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"text": "Great photo!"},
+        {"text": "  padded  "},
+        {"text": "x" * 2200},
+        {"text": "x" * 2201},
+        {"text": "a\x00b"},
+        {"text": "a\ud800b"},
+        {"text": "x" * 2201 + "\x00"},
+        {"text": ""},
+        {"text": "   "},
+        {"text": None},
+        {"text": ["list"]},
+        {"text": 42},
+        {"text": True},
+        {},
+        ["not", "a", "dict"],
+    ],
+)
+def test_matches_create_comment_serializer(body: Any) -> None:
+    """Same cleaned value or same error detail as the DRF serializer."""
+    serializer = CreateCommentSerializer(data=body)
+
+    if serializer.is_valid():
+        assert validate_comment_text(body) == serializer.validated_data["text"]
+    else:
+        with pytest.raises(ValidationError) as exc_info:
+            validate_comment_text(body)
+        assert exc_info.value.detail == serializer.errors
+
+
+@pytest.mark.django_db
+def test_comment_serializer_saves_new_comment() -> None:
+    """``CommentSerializer`` stays writable for ``post`` and ``text``."""
+    post = Post.objects.create(instagram_id="17896129349000001")
+    serializer = CommentSerializer(data={"post": post.pk, "text": "Hi", "status": "failed"})
+
+    assert serializer.is_valid(), serializer.errors
+    comment = serializer.save()
+
+    assert Comment.objects.get().pk == comment.pk
+    assert comment.status == Comment.Status.PUBLISHED
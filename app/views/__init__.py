@@ -8,20 +8,46 @@ logic to the service layer.
 
 from __future__ import annotations
 
+from typing import Any
+
+from django.conf import settings
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from app.serializers import CommentSerializer, CreateCommentSerializer
+from app.models import Comment
+from app.serializers import validate_comment_text
 from app.services import (
-    CommentService,
     InstagramAPIError,
     MediaNotFoundError,
     PostNotFoundError,
+    get_comment_service,
 )
 
 
+def _comment_payload(comment: Comment) -> dict[str, Any]:
+    """
+    Build the response body for a freshly created comment.
+
+    Produces the same shape as ``CommentSerializer(comment).data`` without
+    going through DRF's field machinery — the fields are fixed and already
+    of JSON-friendly types.  Datetimes follow DRF's ISO-8601 ``Z`` style.
+    """
+    created_at = comment.created_at.isoformat()
+    if created_at.endswith("+00:00"):
+        created_at = created_at[:-6] + "Z"
+    return {
+        "id": comment.pk,
+        "post": comment.post_id,
+        "instagram_comment_id": comment.instagram_comment_id,
+        "text": comment.text,
+        "status": comment.status,
+        "created_at": created_at,
+    }
+
+
 class CommentCreateView(APIView):
     """
     POST /api/posts/{id}/comments/
@@ -31,8 +57,12 @@ class CommentCreateView(APIView):
     Request body:
         ``{ "text": "your comment" }``
 
+    When ``INSTAGRAM_PUBLISH_ASYNC`` is enabled the comment is stored as
+    ``pending`` and published by a Celery worker instead of inline.
+
     Responses:
         201 — comment created successfully.
+        202 — comment accepted and queued for publishing (async mode).
         400 — invalid request body.
         404 — post not found in local DB, or media deleted from Instagram.
         502 — Instagram API returned an unexpected error.
@@ -41,12 +71,19 @@ class CommentCreateView(APIView):
     def post(self, request: Request, post_id: int) -> Response:
         """Handle POST — validate input, delegate to service, return result."""
         # Validate request payload
-        input_serializer = CreateCommentSerializer(data=request.data)
-        if not input_serializer.is_valid():
-            return Response(input_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            text = validate_comment_text(request.data)
+        except ValidationError as exc:
+            return Response(exc.detail, status=status.HTTP_400_BAD_REQUEST)
+
+        service = get_comment_service()
 
-        text: str = input_serializer.validated_data["text"]
-        service = CommentService()
+        if settings.INSTAGRAM_PUBLISH_ASYNC:
+            try:
+                comment = service.enqueue_comment(post_id=post_id, text=text)
+            except PostNotFoundError as exc:
+                return Response({"detail": str(exc)}, status=status.HTTP_404_NOT_FOUND)
+            return Response(_comment_payload(comment), status=status.HTTP_202_ACCEPTED)
 
         try:
             comment = service.create_comment(post_id=post_id, text=text)
@@ -60,5 +97,4 @@ class CommentCreateView(APIView):
                 status=status.HTTP_502_BAD_GATEWAY,
             )
 
-        output_serializer = CommentSerializer(comment)
-        return Response(output_serializer.data, status=status.HTTP_201_CREATED)
+        return Response(_comment_payload(comment), status=status.HTTP_201_CREATED)
@@ -5,6 +5,8 @@ Django settings for instagram_project.
 import os
 from pathlib import Path
 
+import dj_database_url
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 SECRET_KEY = os.environ.get('SECRET_KEY', 'django-insecure-dev-secret-key')
@@ -35,34 +37,51 @@ DATABASES = {
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD', 'postgres'),
         'HOST': os.environ.get('POSTGRES_HOST', 'localhost'),
         'PORT': os.environ.get('POSTGRES_PORT', '5432'),
+        # Keep connections open across requests instead of reconnecting each time
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '600')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 # Parse DATABASE_URL if provided (for Docker)
 database_url = os.environ.get('DATABASE_URL')
 if database_url:
-    import re
-    match = re.match(
-        r'postgres://(?P<user>[^:]+):(?P<password>[^@]+)@(?P<host>[^:]+):(?P<port>\d+)/(?P<name>.+)',
-        database_url
+    DATABASES['default'] = dj_database_url.parse(
+        database_url,
+        conn_max_age=DATABASES['default']['CONN_MAX_AGE'],
+        conn_health_checks=True,
     )
-    if match:
-        DATABASES['default'].update({
-            'NAME': match.group('name'),
-            'USER': match.group('user'),
-            'PASSWORD': match.group('password'),
-            'HOST': match.group('host'),
-            'PORT': match.group('port'),
-        })
+
+# PgBouncer in transaction pooling mode cannot keep server-side cursors or
+# prepared statements alive across pooled connections
+if os.environ.get('PGBOUNCER_TRANSACTION_POOLING', 'False') == 'True':
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    DATABASES['default'].setdefault('OPTIONS', {})['prepare_threshold'] = None
+
+# Shared cache (Redis) when CACHE_URL is set, otherwise per-process memory.
+# The in-memory fallback is single-process only: invalidation in one worker
+# is not seen by the others.
+cache_url = os.environ.get('CACHE_URL')
+CACHES = {
+    'default': (
+        {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': cache_url}
+        if cache_url
+        else {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    ),
+}
+
+# Cache post -> Instagram media ID lookups.  Only safe with a shared cache,
+# since entries are dropped on post delete in the deleting process only.
+CACHE_POST_INSTAGRAM_IDS = bool(cache_url)
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'app.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'app.parsers.ORJSONParser',
     ],
 }
 
@@ -70,5 +89,13 @@ REST_FRAMEWORK = {
 INSTAGRAM_ACCESS_TOKEN = os.environ.get('INSTAGRAM_ACCESS_TOKEN', '')
 INSTAGRAM_API_BASE_URL = 'https://graph.facebook.com/v18.0'
 
+# Publish comments from a Celery worker instead of the request thread
+INSTAGRAM_PUBLISH_ASYNC = os.environ.get('INSTAGRAM_PUBLISH_ASYNC', 'False') == 'True'
+
+# Celery settings
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
 USE_TZ = True
 TIME_ZONE = 'UTC'